@@ -7,6 +7,7 @@ from homeassistant.const import CONF_PASSWORD
 from homeassistant.const import CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from requests.exceptions import ConnectionError
@@ -15,7 +16,10 @@ from .client import TelenetClient
 from .const import _LOGGER
 from .const import COORDINATOR_UPDATE_INTERVAL
 from .const import DOMAIN
+from .const import FLOW_CLIENTS
 from .const import PLATFORMS
+from .const import STORAGE_SAVE_DELAY
+from .const import STORAGE_VERSION
 from .exceptions import TelenetException
 from .exceptions import TelenetServiceException
 from .models import TelenetProduct
@@ -26,11 +30,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Telenet from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    client = TelenetClient(
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        language=entry.data[CONF_LANGUAGE],
-    )
+    client = hass.data.get(FLOW_CLIENTS, {}).pop(entry.unique_id, None)
+    store = address_store(hass, entry)
+    addresses = await store.async_load() or {}
+    if client is None or client.password != entry.data[CONF_PASSWORD]:
+        if client is not None:
+            client.close()
+        client = TelenetClient(
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+            language=entry.data[CONF_LANGUAGE],
+            addresses=addresses,
+        )
+    else:
+        client.addresses = addresses
 
     dev_reg = dr.async_get(hass)
     hass.data[DOMAIN][entry.entry_id] = coordinator = TelenetDataUpdateCoordinator(
@@ -38,9 +51,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         config_entry_id=entry.entry_id,
         dev_reg=dev_reg,
         client=client,
+        store=store,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # A retried setup builds a new client, release this one's pool and session
+        hass.data[DOMAIN].pop(entry.entry_id)
+        client.close()
+        raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -49,12 +69,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    discard_flow_client(hass, entry)
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id).client.close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached addresses of a config entry."""
+    discard_flow_client(hass, entry)
+    await address_store(hass, entry).async_remove()
+
+
+def discard_flow_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close a config flow client that was never picked up by the entry setup."""
+    client = hass.data.get(FLOW_CLIENTS, {}).pop(entry.unique_id, None)
+    if client is not None:
+        client.close()
+
+
+def address_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the address cache store of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.addresses")
+
+
 class TelenetDataUpdateCoordinator(DataUpdateCoordinator):
     """Data update coordinator for Telenet."""
 
@@ -67,6 +106,7 @@ class TelenetDataUpdateCoordinator(DataUpdateCoordinator):
         config_entry_id: str,
         dev_reg: dr.DeviceRegistry,
         client: TelenetClient,
+        store: Store,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
@@ -79,6 +119,8 @@ class TelenetDataUpdateCoordinator(DataUpdateCoordinator):
         self._device_registry = dev_reg
         self.client = client
         self.hass = hass
+        self._store = store
+        self._stored_addresses = len(client.addresses)
 
     async def _async_update_data(self) -> dict | None:
         """Update data."""
@@ -97,6 +139,13 @@ class TelenetDataUpdateCoordinator(DataUpdateCoordinator):
 
         products: list[TelenetProduct] = products
 
+        if len(self.client.addresses) != self._stored_addresses:
+            addresses = dict(self.client.addresses)
+            self._stored_addresses = len(addresses)
+            self._store.async_delay_save(
+                lambda addresses=addresses: addresses, STORAGE_SAVE_DELAY
+            )
+
         current_products = {
             list(device.identifiers)[0][1]
             for device in dr.async_entries_for_config_entry(
@@ -118,7 +167,7 @@ class TelenetDataUpdateCoordinator(DataUpdateCoordinator):
                     ):
                         log_debug(
                             f"[init|TelenetDataUpdateCoordinator|_async_update_data|async_remove_device] {product_identifier}",
-                            True,
+                            force=True,
                         )
                         self._device_registry.async_remove_device(device.id)
 
@@ -1,19 +1,29 @@
 """Telenet API Client."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
+from threading import RLock
 
 from requests import (
     Session,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
+from .const import AUTHORIZE_URL_TEMPLATE
 from .const import BASE_HEADERS
 from .const import CONNECTION_RETRY
 from .const import DATE_FORMAT
-from .const import DATETIME_FORMAT
 from .const import DEFAULT_LANGUAGE
 from .const import DEFAULT_TELENET_ENVIRONMENT
+from .const import REQUEST_POOL_SIZE
+from .const import REQUEST_RETRY
+from .const import REQUEST_RETRY_BACKOFF
 from .const import REQUEST_TIMEOUT
+from .const import REQUEST_WORKERS
+from .const import SERVICE_ERROR_CODES
 from .exceptions import BadCredentialsException
 from .exceptions import TelenetServiceException
 from .models import TelenetBundleProductExtraAttributes
@@ -26,11 +36,25 @@ from .models import TelenetTelephoneProductExtraAttributes
 from .utils import clean_ipv6
 from .utils import float_to_timestring
 from .utils import format_entity_name
-from .utils import get_json_dict_path
 from .utils import get_localized
+from .utils import has_units
 from .utils import log_debug
+from .utils import parse_billing_date
+from .utils import response_json
 from .utils import str_to_float
 
+DAILY_USAGE_FIELDS = itemgetter("peak", "offPeak", "total", "date")
+EXTRA_ATTRIBUTE_KEYS = {
+    product_type: frozenset(attributes.__annotations__)
+    for product_type, attributes in {
+        "internet": TelenetInternetProductExtraAttributes,
+        "mobile": TelenetMobileProductExtraAttributes,
+        "dtv": TelenetDtvProductExtraAttributes,
+        "telephone": TelenetTelephoneProductExtraAttributes,
+        "bundle": TelenetBundleProductExtraAttributes,
+    }.items()
+}
+
 
 class TelenetClient:
     """Telenet client."""
@@ -46,22 +70,67 @@ class TelenetClient:
         headers: dict | None = BASE_HEADERS,
         language: str | None = DEFAULT_LANGUAGE,
         environment: TelenetEnvironment = DEFAULT_TELENET_ENVIRONMENT,
+        addresses: dict | None = None,
     ) -> None:
         """Initialize TelenetClient."""
         self.session = session if session else Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=REQUEST_POOL_SIZE,
+                max_retries=Retry(
+                    total=REQUEST_RETRY,
+                    backoff_factor=REQUEST_RETRY_BACKOFF,
+                    respect_retry_after_header=False,
+                ),
+            ),
+        )
         self.username = username
         self.password = password
         self.language = language
         self.environment = environment
-        self.session.headers = headers
+        self.session.headers = dict(headers)
         self.all_products = {}
-        self.product_types = []
+        self.product_types = set()
         self.all_products_by_type = {}
         self.user_details = {}
         self.plan_products = {}
-        self.addresses = {}
+        self.addresses = addresses if addresses is not None else {}
+        self._missing_addresses = set()
+        self._product_details = {}
+        self._localized_names = {}
+        self._xsrf_token = None
+        self._mobile_usage = {}
+        self._mobile_bundle_usage = {}
+        self._now = datetime.now()
+        self._invoice_product = None
+        self._user_product = None
+        self._extra_sensor_handlers = {
+            "internet": self.create_internet_sensors,
+            "dtv": self.create_dtv_sensors,
+            "mobile": self.create_mobile_sensors,
+        }
         self.request_error = {}
         self.total_cost = 0
+        self._login_lock = RLock()
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the pool for the sub-requests of a refresh, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=REQUEST_WORKERS, thread_name_prefix="telenet"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the request pool and close the session."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
 
     def request(
         self,
@@ -73,21 +142,26 @@ class TelenetClient:
         retrying=False,
         connection_retry_left=CONNECTION_RETRY,
     ) -> dict:
-        """Send a request to Telenet."""
-        if data is None:
-            log_debug(f"{caller} Calling GET {url}")
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-        else:
-            log_debug(f"{caller} Calling POST {url}")
-            response = self.session.post(url, data, timeout=REQUEST_TIMEOUT)
-        log_debug(
-            f"{caller} http status code = {response.status_code} (expecting {expected})"
-        )
-        if log:
-            log_debug(f"{caller} Response:\n{response.text}")
-        if expected is not None and response.status_code != expected:
+        """Send a request to Telenet, logging in again and retrying when needed."""
+        while True:
+            if data is None:
+                log_debug("%s Calling GET %s", caller, url)
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            else:
+                log_debug("%s Calling POST %s", caller, url)
+                response = self.session.post(url, data, timeout=REQUEST_TIMEOUT)
+            log_debug(
+                "%s http status code = %s (expecting %s)",
+                caller,
+                response.status_code,
+                expected,
+            )
+            if log:
+                log_debug("%s Response:\n%s", caller, response.text)
+            if expected is None or response.status_code == expected:
+                break
             if response.status_code == 404:
-                self.request_error = response.json()
+                self.request_error = response_json(response)
                 return False
             if (
                 response.status_code != 403
@@ -100,65 +174,103 @@ class TelenetClient:
                     f"[{caller}] Expecting HTTP {expected} | Response HTTP {response.status_code}, Response: {response.text}, Url: {response.url}"
                 )
             if response.status_code == 403:
-                r = response.text
-                if r.find("code") != -1:
-                    if response.json().get("code") not in ["OCAPI-ERR-667"]:
+                try:
+                    body = response_json(response)
+                except ValueError:
+                    body = {}
+                if isinstance(body, dict) and "code" in body:
+                    if body.get("code") not in SERVICE_ERROR_CODES:
                         log_debug(
-                            f"[{caller}] Telenet Service Access Forbidden for {self.username}: {response.status_code} => {response.json()}",
+                            "[%s] Telenet Service Access Forbidden for %s: %s => %s",
+                            caller,
+                            self.username,
+                            response.status_code,
+                            body,
                         )
-                        self.request_error = response.json()
+                        self.request_error = body
                         return False
                     raise TelenetServiceException(
-                        f"{response.json().get('cause')} for {self.username}"
+                        f"{body.get('cause')} for {self.username}"
                     )
+            if connection_retry_left <= 0:
+                raise TelenetServiceException(
+                    f"[{caller}] Expecting HTTP {expected} | Response HTTP {response.status_code} after {CONNECTION_RETRY} retries, Url: {response.url}"
+                )
 
             log_debug(
-                f"[TelenetClient|request] Received a HTTP {response.status_code}, nothing to worry about! We give it another try :-)"
+                "[TelenetClient|request] Received a HTTP %s, nothing to worry about! We give it another try :-)",
+                response.status_code,
             )
-            self.login()
-            response = self.request(
-                url, caller, data, expected, log, True, connection_retry_left - 1
-            )
-        self.session.headers["X-TOKEN-XSRF"] = self.session.cookies.get("TOKEN-XSRF")
+            with self._login_lock:
+                self.login()
+            retrying = True
+            connection_retry_left -= 1
+        self.update_xsrf_header()
         return response
 
+    def update_xsrf_header(self) -> None:
+        """Copy the TOKEN-XSRF cookie into the request headers when it changed."""
+        token = self.session.cookies.get("TOKEN-XSRF")
+        if token != self._xsrf_token:
+            self.session.headers["X-TOKEN-XSRF"] = token
+            self._xsrf_token = token
+
     def login(self) -> dict:
         """Start a new Telenet session with a user & password."""
+        user_details = self.authenticate()
+        if user_details is not None:
+            # Return if already authenticated
+            return user_details
+        response = self.request(
+            "https://api.prd.telenet.be/ocapi/oauth/userdetails",
+            "[TelenetClient|login|user_details]",
+            None,
+            200,
+        )
+        if response is False:
+            raise TelenetServiceException("No user details returned after login")
+        user_details = response_json(response)
+        if "customer_number" not in user_details:
+            raise BadCredentialsException(
+                f"HTTP {response.status_code} Missing customer number"
+            )
+        self.user_details = user_details
+        return user_details
+
+    def authenticate(self) -> dict | None:
+        """Authenticate with user & password, return the user details if already authenticated."""
 
         log_debug("[TelenetClient|login|start]")
-        tokens = []
-        token_fetch_count = 0
-        while len(tokens) != 2:
-            response = self.request(
-                f"{self.environment.ocapi}/oauth/userdetails",
-                "[TelenetClient|login]",
-                None,
-                None,
+        response = self.request(
+            f"{self.environment.ocapi}/oauth/userdetails",
+            "[TelenetClient|login]",
+            None,
+            None,
+        )
+        if response.status_code == 200:
+            return response_json(response)
+        if response.status_code != 401 and response.status_code != 403:
+            raise TelenetServiceException(
+                f"HTTP {response.status_code} error while authenticating {response.url}"
             )
-            if response.status_code == 200:
-                # Return if already authenticated
-                return response.json()
-            if response.status_code != 401 and response.status_code != 403:
-                raise TelenetServiceException(
-                    f"HTTP {response.status_code} error while authenticating {response.url}"
-                )
-            """Fetch state & nonce"""
-            tokens = response.text.split(",", maxsplit=2)
-            if token_fetch_count > CONNECTION_RETRY:
-                raise TelenetServiceException(
-                    f"HTTP 401 not returning the tokens for {response.url}"
-                )
-            token_fetch_count += 1
-        state, nonce = response.text.split(",", maxsplit=2)
+        """Fetch state & nonce"""
+        tokens = response.text.split(",", maxsplit=2)
+        if len(tokens) < 2:
+            raise TelenetServiceException(
+                f"HTTP {response.status_code} not returning the tokens for {response.url}"
+            )
+        state, nonce, *_ = tokens
         """Login process"""
         response = self.request(
-            f'{self.environment.openid}/oauth/authorize?client_id=ocapi&response_type=code&claims={{"id_token":{{"http://telenet.be/claims/roles":null,"http://telenet.be/claims/licenses":null}}}}&lang=nl&state={state}&nonce={nonce}&prompt=login',
+            AUTHORIZE_URL_TEMPLATE.format(
+                openid=self.environment.openid, state=state, nonce=nonce
+            ),
             "[TelenetClient|login|authorize]",
             None,
             None,
         )
         if response.status_code != 200 or "openid/login" not in str(response.url):
-            raise TelenetServiceException(response.text())
+            raise TelenetServiceException(response.text)
         response = self.request(
             f"{self.environment.openid}/login.do",
             "[TelenetClient|login|login.do]",
@@ -169,28 +281,18 @@ class TelenetClient:
             },
             200,
         )
+        if response is False:
+            raise TelenetServiceException(self.request_error)
         if "authentication_error" in response.url:
             raise BadCredentialsException(response.text)
-        self.session.headers["X-TOKEN-XSRF"] = self.session.cookies.get("TOKEN-XSRF")
-        response = self.request(
-            "https://api.prd.telenet.be/ocapi/oauth/userdetails",
-            "[TelenetClient|login|user_details]",
-            None,
-            200,
-        )
-        user_details = response.json()
-        if "customer_number" not in user_details:
-            raise BadCredentialsException(
-                f"HTTP {response.status_code} Missing customer number"
-            )
-        self.user_details = user_details
-        return response.json()
+        self.update_xsrf_header()
+        return None
 
     def add_product_type(self, product_type):
         """Add a discovered product type."""
         if product_type not in self.product_types:
-            log_debug(f"[TelenetClient|add_product_type] {product_type}")
-            self.product_types.append(product_type)
+            log_debug("[TelenetClient|add_product_type] %s", product_type)
+            self.product_types.add(product_type)
 
     def add_product(
         self, product: dict, plan_identifier: str, state_prop: str, plan_label: str
@@ -201,32 +303,34 @@ class TelenetClient:
             return False
         type = product.get("productType")
         log_debug(
-            f"[TelenetClient|add_product] {identifier}, productType: {type}, plan_label: {plan_label}"
+            "[TelenetClient|add_product] %s, productType: %s, plan_label: %s",
+            identifier,
+            type,
+            plan_label,
         )
         product_price = None
         if product.get("specurl") is not None:
-            product_info = self.product_details(product.get("specurl")).get("product")
-            try:
-                salespricevatincl = product_info.get("characteristics").get(
-                    "salespricevatincl"
+            product_info = (
+                self.product_details(product.get("specurl")).get("product") or {}
+            )
+            characteristics = product_info.get("characteristics") or {}
+            salespricevatincl = characteristics.get("salespricevatincl") or {}
+            if (
+                salespricevatincl.get("value") is not None
+                and str_to_float(salespricevatincl.get("value")) > 0
+            ):
+                log_debug(
+                    "[TelenetClient|add_product] Sales Price found for %s %s: %s",
+                    identifier,
+                    type,
+                    salespricevatincl,
                 )
-                price = str_to_float(salespricevatincl.get("value"))
-                if price > 0:
-                    log_debug(
-                        f"[TelenetClient|add_product] Sales Price found for {identifier} {type}: {salespricevatincl}"
-                    )
-                    product_price = salespricevatincl
-            except Exception:
-                pass
-
+                product_price = salespricevatincl
         else:
             product_info = {}
-        try:
-            state = get_localized(
-                self.language, product_info.get("localizedcontent")
-            ).get("name")
-        except Exception:
-            state = product.get("label")
+        state = get_localized(self.language, product_info.get("localizedcontent")).get(
+            "name", product.get("label")
+        )
         self.all_products[identifier] = TelenetProduct(
             product_identifier=identifier,
             product_type=type,
@@ -253,13 +357,16 @@ class TelenetClient:
         if len(self.all_products) > 0 and force_refresh is False:
             """Return the Telenet products present in the Client session"""
             log_debug("[TelenetClient|products] Returning cached products")
-            return [self.all_products.get(product) for product in self.all_products]
+            return list(self.all_products.values())
         self.login()
         self.total_cost = 0
         log_debug("[TelenetClient|products] Fetching active products from Telenet")
         """ Refresh products """
         self.all_products = {}
-        self.product_types = []
+        self.product_types = set()
+        # Catalog details only dedup within a refresh, so price changes come through
+        self._product_details = {}
+        self._localized_names = {}
         response = self.request(
             "https://api.prd.telenet.be/ocapi/public/api/product-service/v1/products?status=ACTIVE",
             "[TelenetClient|products]",
@@ -270,7 +377,7 @@ class TelenetClient:
             raise TelenetServiceException(
                 "No products found. Either the API is currently down or you are not migrated to the new Telenet IT system yet."
             )
-        for a_product in response.json():
+        for a_product in response_json(response):
             plan_identifier = a_product.get("identifier")
             plan_label = a_product.get("label")
             self.add_product(
@@ -281,11 +388,15 @@ class TelenetClient:
             )
             dtv_found = False
             log_debug(
-                f"[TelenetClient|products] Parent product {a_product.get('identifier')} {a_product.get('productType')}"
+                "[TelenetClient|products] Parent product %s %s",
+                plan_identifier,
+                a_product.get("productType"),
             )
             for product in a_product.get("children"):
                 log_debug(
-                    f"[TelenetClient|products] Child product {product.get('identifier')} {product.get('productType')}"
+                    "[TelenetClient|products] Child product %s %s",
+                    product.get("identifier"),
+                    product.get("productType"),
                 )
                 if product.get("productType") == "dtv":
                     dtv_found = True
@@ -314,10 +425,12 @@ class TelenetClient:
         self.plan_info()
         self.create_extra_sensors()
         self.set_extra_attributes()
-        return [self.all_products.get(product) for product in self.all_products]
+        self.update_customer_products()
+        return list(self.all_products.values())
 
     def construct_extra_sensor(
         self,
+        new_products,
         product,
         suffix,
         product_description_key,
@@ -325,692 +438,635 @@ class TelenetClient:
         product_extra_attributes={},
         use_plan_identifier=False,
         native_unit_of_measurement=None,
-    ) -> list:
-        """For each found product add extra product sensors."""
+    ) -> None:
+        """Add an extra product sensor for a found product to new_products."""
         type = product.product_type
         identifier = product.product_identifier
         plan_identifier = product.product_plan_identifier
         if use_plan_identifier:
             identifier = plan_identifier
         product_key = format_entity_name(f"{identifier} {type} {suffix}")
-        return {
-            product_key: TelenetProduct(
-                product_identifier=f"{identifier} {suffix}",
-                product_type=type,
-                product_description_key=product_description_key,
-                product_plan_identifier=plan_identifier,
-                product_plan_label=product.product_plan_label,
-                product_name=f"{identifier} {suffix}",
-                product_key=product_key,
-                product_state=product_state,
-                product_extra_sensor=True,
-                product_extra_attributes=product_extra_attributes,
-                native_unit_of_measurement=native_unit_of_measurement,
+        new_products[product_key] = TelenetProduct(
+            product_identifier=f"{identifier} {suffix}",
+            product_type=type,
+            product_description_key=product_description_key,
+            product_plan_identifier=plan_identifier,
+            product_plan_label=product.product_plan_label,
+            product_name=f"{identifier} {suffix}",
+            product_key=product_key,
+            product_state=product_state,
+            product_extra_sensor=True,
+            product_extra_attributes=product_extra_attributes,
+            native_unit_of_measurement=native_unit_of_measurement,
+        )
+
+    def construct_plan_extra_sensor(
+        self,
+        new_products,
+        product,
+        suffix,
+        product_description_key,
+        product_state,
+        product_extra_attributes={},
+    ) -> None:
+        """Add an extra sensor keyed on the plan of a found product to new_products."""
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            suffix,
+            product_description_key,
+            product_state,
+            product_extra_attributes,
+            True,
+        )
+
+    def prefetch_mobile_usage(self) -> None:
+        """Start fetching the usage of all mobile products."""
+        self._mobile_usage = {}
+        self._mobile_bundle_usage = {}
+        for product in self.all_products.values():
+            if product.product_type != "mobile":
+                continue
+            identifier = product.product_identifier
+            plan_identifier = product.product_plan_identifier
+            if plan_identifier == identifier:
+                self._mobile_usage[identifier] = self.executor.submit(
+                    self.mobile_usage, identifier
+                )
+                continue
+            self._mobile_usage[identifier] = self.executor.submit(
+                self.mobile_bundle_usage, plan_identifier, identifier
             )
-        }
+            if plan_identifier not in self._mobile_bundle_usage:
+                self._mobile_bundle_usage[plan_identifier] = self.executor.submit(
+                    self.mobile_bundle_usage, plan_identifier
+                )
 
     def create_extra_sensors(self) -> bool:
         """Create extra sensors."""
         new_products = {}
-        for product in self.all_products:
-            product = self.all_products[product]
+        self._now = datetime.now()
+        self.prefetch_mobile_usage()
+        for product in list(self.all_products.values()):
             type = product.product_type
             identifier = product.product_identifier
-            plan_identifier = product.product_plan_identifier
-            product_specs = self.product_details(product.product_specurl).get("product")
-            product_type_attr = {
-                "product type": get_localized(
+            product_specs = product.product_info or (
+                self.product_details(product.product_specurl).get("product")
+                if product.product_specurl
+                else {}
+            )
+            localized_name = self._localized_names.get(product.product_specurl)
+            if localized_name is None:
+                localized_name = get_localized(
                     self.language, product_specs.get("localizedcontent")
                 ).get("name")
-            }
-            log_debug(f"[TelenetClient|create_extra_sensors] {identifier} {type}")
+                self._localized_names[product.product_specurl] = localized_name
+            product_type_attr = {"product type": localized_name}
+            log_debug("[TelenetClient|create_extra_sensors] %s %s", identifier, type)
             if product.product_price is not None:
-                product_without_specurl = product
-                product_without_specurl.specurl = None
                 self.total_cost += str_to_float(product.product_price.get("value"))
-                new_products.update(
-                    self.construct_extra_sensor(
-                        product_without_specurl,
-                        "price",
-                        "euro",
-                        str_to_float(product.product_price.get("value")),
-                        product.product_price | product_type_attr,
-                    )
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    "price",
+                    "euro",
+                    str_to_float(product.product_price.get("value")),
+                    {**product.product_price, **product_type_attr},
                 )
 
-            if type == "internet":
-                """------------------------"""
-                """| EXTRA INTERNET SENSORS |"""
-                """ ------------------------ """
-                billcycle = self.bill_cycles(type, identifier, 2)
-                product_usage = self.product_usage(
-                    type,
-                    identifier,
-                    billcycle.get("start_date"),
-                    billcycle.get("end_date"),
+            handler = self._extra_sensor_handlers.get(type)
+            if handler is not None:
+                handler(product, product_specs, product_type_attr, new_products)
+        self.all_products.update(new_products)
+        return True
+
+    def update_customer_products(self) -> None:
+        """Update the invoice and user products once the refresh succeeded."""
+        customer_number = self.user_details.get("customer_number")
+        first_name = self.user_details.get("first_name")
+        invoice = self._invoice_product
+        if invoice is None or invoice.product_plan_identifier != customer_number:
+            product_name = "current invoice"
+            product_key = format_entity_name(f"{customer_number} {product_name}")
+            invoice = self._invoice_product = TelenetProduct(
+                product_identifier=f"{customer_number} {product_name}",
+                product_type="invoice",
+                product_description_key="euro",
+                product_name=f"{product_name}",
+                product_key=product_key,
+                product_plan_identifier=customer_number,
+                product_plan_label="Customer",
+                product_extra_sensor=True,
+            )
+        user = self._user_product
+        if user is None or user.product_plan_identifier != customer_number:
+            product_name = "user details"
+            product_key = format_entity_name(f"{customer_number} {product_name}")
+            user = self._user_product = TelenetProduct(
+                product_identifier=f"{product_name}",
+                product_type="user",
+                product_description_key="user",
+                product_name=f"{product_name}",
+                product_key=product_key,
+                product_plan_identifier=customer_number,
+                product_plan_label="Customer",
+                product_extra_sensor=True,
+            )
+        # These objects are shared with the previous refresh, only update them here
+        invoice.product_state = self.total_cost
+        user.product_state = first_name
+        user.product_extra_attributes = self.user_details
+        self.all_products[invoice.product_key] = invoice
+        self.all_products[user.product_key] = user
+
+    def create_internet_sensors(
+        self, product, product_specs, product_type_attr, new_products
+    ) -> None:
+        """Create extra internet sensors."""
+        type = product.product_type
+        identifier = product.product_identifier
+        billcycle = self.bill_cycles(type, identifier, 2)
+        product_usage_future = self.executor.submit(
+            self.product_usage,
+            type,
+            identifier,
+            billcycle.get("start_date"),
+            billcycle.get("end_date"),
+        )
+        modem_future = self.executor.submit(self.modems, identifier)
+        daily_usage_futures = [
+            self.executor.submit(
+                self.product_daily_usage,
+                type,
+                identifier,
+                cycle.get("billCycle"),
+                cycle.get("startDate"),
+                cycle.get("endDate"),
+            )
+            for cycle in billcycle.get("cycles")
+        ]
+        product_usage = product_usage_future.result()
+        if product_usage is False:
+            log_debug(
+                "[create_extra_sensors|internet|product_usage] Failed to fetch, skipping"
+            )
+            return
+        daily_usages = []
+        product_daily_usage = {}
+        for cycle, daily_usage_future in zip(
+            billcycle.get("cycles"), daily_usage_futures
+        ):
+            daily_usage = daily_usage_future.result()
+            if len(daily_usage) == 0:
+                continue
+            product_daily_usage[cycle.get("billCycle")] = daily_usage
+            daily_usages.extend(
+                map(
+                    DAILY_USAGE_FIELDS,
+                    daily_usage.get("internetUsage")[0].get("dailyUsages"),
                 )
-                if product_usage is False:
-                    log_debug(
-                        "[create_extra_sensors|internet|product_usage] Failed to fetch, skipping"
-                    )
-                    continue
-                daily_peak = []
-                daily_off_peak = []
-                daily_total = []
-                daily_date = []
-                product_daily_usage = {}
-                for cycle in billcycle.get("cycles"):
-                    daily_usage = self.product_daily_usage(
-                        type,
-                        identifier,
-                        cycle.get("billCycle"),
-                        cycle.get("startDate"),
-                        cycle.get("endDate"),
-                    )
-                    if len(daily_usage) == 0:
-                        continue
-                    product_daily_usage |= {cycle.get("billCycle"): daily_usage}
-                    for day in (
-                        product_daily_usage.get(cycle.get("billCycle"))
-                        .get("internetUsage")[0]
-                        .get("dailyUsages")
-                    ):
-                        daily_peak.append(day.get("peak"))
-                        daily_off_peak.append(day.get("offPeak"))
-                        daily_total.append(day.get("total"))
-                        daily_date.append(day.get("date"))
+            )
+        if daily_usages:
+            daily_peak, daily_off_peak, daily_total, daily_date = (
+                list(column) for column in zip(*daily_usages)
+            )
+        else:
+            daily_peak, daily_off_peak, daily_total, daily_date = [], [], [], []
 
-                product_daily_usage = product_daily_usage.get("CURRENT")
-                if product_daily_usage is False:
-                    log_debug(
-                        "[create_extra_sensors|internet|product_daily_usage] Failed to fetch, skipping"
-                    )
-                    continue
-                modem = self.modems(identifier)
-                if modem is False:
-                    log_debug(
-                        "[create_extra_sensors|internet|modem] Failed to fetch, skipping"
-                    )
-                    continue
-                usage = product_usage.get(type)
-                usage_pct = (
-                    100
-                    * usage.get("totalUsage").get("units")
-                    / (
-                        usage.get("allocatedUsage").get("units")
-                        + usage.get("extendedUsage").get("volume")
+        product_daily_usage = product_daily_usage.get("CURRENT")
+        if product_daily_usage is False:
+            log_debug(
+                "[create_extra_sensors|internet|product_daily_usage] Failed to fetch, skipping"
+            )
+            return
+        modem = modem_future.result()
+        if modem is False:
+            log_debug("[create_extra_sensors|internet|modem] Failed to fetch, skipping")
+            return
+        current_usage = product_daily_usage.get("internetUsage")[0].get("totalUsage")
+        usage = product_usage.get(type)
+        total_usage = usage.get("totalUsage")
+        allocated_usage = usage.get("allocatedUsage")
+        extended_usage = usage.get("extendedUsage")
+        wifree_usage = usage.get("wifreeUsage")
+        peak_used = usage.get("peakUsage").get("usedUnits")
+        off_peak = round(current_usage.get("offPeak"), 1)
+        sales_price = product_specs.get("characteristics").get("salespricevatincl")
+        usage_pct = (
+            100
+            * total_usage.get("units")
+            / (allocated_usage.get("units") + extended_usage.get("volume"))
+        )
+        period_start = datetime.strptime(billcycle.get("start_date"), DATE_FORMAT)
+        period_end = datetime.strptime(billcycle.get("end_date"), DATE_FORMAT)
+        period_length = period_end - period_start
+        period_length_days = period_length.days
+        period_length_seconds = period_length.total_seconds()
+        period_used = self._now - period_start
+        period_used_seconds = period_used.total_seconds()
+        period_used_percentage = round(
+            100 * period_used_seconds / period_length_seconds, 1
+        )
+        attributes = {
+            "identifier": identifier,
+            "last_update": total_usage.get("lastUsageDate"),
+            "start_date": billcycle.get("start_date"),
+            "end_date": billcycle.get("end_date"),
+            "days_until": usage.get("daysUntil"),
+            "total_usage": f"{total_usage.get('units')} {total_usage.get('unitType')}",
+            "wifree_usage": f"{wifree_usage.get('usedUnits')} {wifree_usage.get('unitType')}",
+            "allocated_usage": f"{allocated_usage.get('units')} {allocated_usage.get('unitType')}",
+            "extended_usage": f"{extended_usage.get('volume')} {extended_usage.get('unit')}",
+            "extended_usage_price": f"{extended_usage.get('price')} {extended_usage.get('currency')}",
+            "peak_usage": peak_used,
+            "offpeak_usage": off_peak,
+            "total_usage_with_offpeak": peak_used + off_peak,
+            "used_percentage": round(usage_pct, 2),
+            "period_used_percentage": period_used_percentage,
+            "period_remaining_percentage": (100 - period_used_percentage),
+            "squeezed": usage_pct >= 100,
+            "period_length": period_length_days,
+            "product_label": product_type_attr.get("product type"),
+            "sales_price": f"{sales_price.get('value')} {sales_price.get('unit')}",
+        }
+        service = ""
+        language = self.language
+        for services in product_specs.get("services"):
+            for specification in services.get("specifications"):
+                label_key = specification.get("labelkey")
+                value = specification.get("value")
+                unit = specification.get("unit")
+                if label_key == "spec.fixedinternet.speed.download":
+                    attributes["download_speed"] = f"{value} {unit}"
+                elif label_key == "spec.fixedinternet.speed.upload":
+                    attributes["upload_speed"] = f"{value} {unit}"
+                if specification.get("visible"):
+                    localized = get_localized(
+                        language, specification.get("localizedcontent")
                     )
+                    service += f"{localized.get('name')}"
+                    if value is not None:
+                        service += f" {value}"
+                    if unit is not None:
+                        service += f" {unit}"
+                    service += "\n"
+        if usage_pct >= 100:
+            attributes["download_speed"] = "1 Mbps"
+            attributes["upload_speed"] = "256 Kbps"
+        attributes["service"] = service
+
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            "usage",
+            "usage_percentage",
+            usage_pct,
+            attributes,
+        )
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            "daily usage",
+            "data_usage",
+            current_usage.get("peak"),
+            {
+                **current_usage,
+                "daily_peak": daily_peak,
+                "daily_off_peak": daily_off_peak,
+                "daily_total": daily_total,
+                "daily_date": daily_date,
+            },
+        )
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            "modem",
+            "modem",
+            modem.get("name"),
+            dict(modem),
+        )
+        wireless_settings_future = self.executor.submit(
+            self.wireless_settings, modem.get("mac"), identifier
+        )
+        network_topology = clean_ipv6(self.network_topology(modem.get("mac")))
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            "network",
+            "network",
+            network_topology.get("model"),
+            dict(network_topology),
+        )
+        wireless_settings = wireless_settings_future.result()
+        if wireless_settings is not False:
+            wifi_qr = None
+            self.construct_extra_sensor(
+                new_products,
+                product,
+                "wi-fi",
+                "wifi",
+                wireless_settings.get("wirelessEnabled"),
+                dict(wireless_settings),
+            )
+            if "networkKey" in wireless_settings.get("singleSSIDRoamingSettings"):
+                network_key = (
+                    wireless_settings.get("singleSSIDRoamingSettings")
+                    .get("networkKey")
+                    .replace(":", r"\:")
                 )
-                period_length = datetime.strptime(
-                    billcycle.get("end_date"), DATE_FORMAT
-                ) - datetime.strptime(billcycle.get("start_date"), DATE_FORMAT)
-                period_length_days = period_length.days
-                period_length_seconds = period_length.total_seconds()
-                period_used = datetime.now() - datetime.strptime(
-                    billcycle.get("start_date"), DATE_FORMAT
-                )
-                period_used_seconds = period_used.total_seconds()
-                period_used_percentage = round(
-                    100 * period_used_seconds / period_length_seconds, 1
+                wifi_qr = f"WIFI:S:{wireless_settings.get('singleSSIDRoamingSettings').get('name')};T:WPA;P:{network_key};;"
+                self.construct_extra_sensor(
+                    new_products, product, "wi-fi qr", "qr", wifi_qr
                 )
-                attributes = {
-                    "identifier": identifier,
-                    "last_update": usage.get("totalUsage").get("lastUsageDate"),
-                    "start_date": billcycle.get("start_date"),
-                    "end_date": billcycle.get("end_date"),
-                    "days_until": usage.get("daysUntil"),
-                    "total_usage": f"{usage.get('totalUsage').get('units')} {usage.get('totalUsage').get('unitType')}",
-                    "wifree_usage": f"{usage.get('wifreeUsage').get('usedUnits')} {usage.get('wifreeUsage').get('unitType')}",
-                    "allocated_usage": f"{usage.get('allocatedUsage').get('units')} {usage.get('allocatedUsage').get('unitType')}",
-                    "extended_usage": f"{usage.get('extendedUsage').get('volume')} {usage.get('extendedUsage').get('unit')}",
-                    "extended_usage_price": f"{usage.get('extendedUsage').get('price')} {usage.get('extendedUsage').get('currency')}",
-                    "peak_usage": usage.get("peakUsage").get("usedUnits"),
-                    "offpeak_usage": round(
-                        get_json_dict_path(
-                            product_daily_usage, "$.internetUsage[0].totalUsage.offPeak"
-                        ),
-                        1,
-                    ),
-                    "total_usage_with_offpeak": usage.get("peakUsage").get("usedUnits")
-                    + round(
-                        get_json_dict_path(
-                            product_daily_usage, "$.internetUsage[0].totalUsage.offPeak"
-                        ),
-                        1,
-                    ),
-                    "used_percentage": round(usage_pct, 2),
-                    "period_used_percentage": period_used_percentage,
-                    "period_remaining_percentage": (100 - period_used_percentage),
-                    "squeezed": usage_pct >= 100,
-                    "period_length": period_length_days,
-                    "product_label": get_localized(
-                        self.language, product_specs.get("localizedcontent")
-                    ).get("name"),
-                    "sales_price": f"{product_specs.get('characteristics').get('salespricevatincl').get('value')} {product_specs.get('characteristics').get('salespricevatincl').get('unit')}",
-                }
-                service = ""
-                for services in product_specs.get("services"):
-                    for specification in services.get("specifications"):
-                        if (
-                            specification.get("labelkey")
-                            == "spec.fixedinternet.speed.download"
-                        ):
-                            attributes[
-                                "download_speed"
-                            ] = f"{specification.get('value')} {specification.get('unit')}"
-                        elif (
-                            specification.get("labelkey")
-                            == "spec.fixedinternet.speed.upload"
-                        ):
-                            attributes[
-                                "upload_speed"
-                            ] = f"{specification.get('value')} {specification.get('unit')}"
-                        if specification.get("visible"):
-                            service += f"{get_localized(self.language, specification.get('localizedcontent')).get('name')}"
-                            if specification.get("value") is not None:
-                                service += f" {specification.get('value')}"
-                            if specification.get("unit") is not None:
-                                service += f" {specification.get('unit')}"
-                            service += "\n"
-                if usage_pct >= 100:
-                    attributes["download_speed"] = "1 Mbps"
-                    attributes["upload_speed"] = "256 Kbps"
-                attributes["service"] = service
 
-                new_products.update(
-                    self.construct_extra_sensor(
-                        product,
-                        "usage",
-                        "usage_percentage",
-                        usage_pct,
-                        attributes,
-                    )
+    def create_dtv_sensors(
+        self, product, product_specs, product_type_attr, new_products
+    ) -> None:
+        """Create extra dtv sensors."""
+        if product.product_ignore_extra_sensor:
+            return
+        type = product.product_type
+        identifier = product.product_identifier
+        devices_future = self.executor.submit(self.device_details, type, identifier)
+        billcycle = self.bill_cycles(type, identifier, 1)
+        product_usage = self.product_usage(
+            type,
+            identifier,
+            billcycle.get("start_date"),
+            billcycle.get("end_date"),
+        )
+        if product_usage is False:
+            log_debug(
+                "[create_extra_sensors|dtv|product_usage] Failed to fetch, skipping"
+            )
+            return
+        devices = devices_future.result()
+        if devices is False:
+            log_debug("[create_extra_sensors|dtv|devices] Failed to fetch, skipping")
+            return
+
+        dtv_usage = product_usage.get("dtv")
+        self.total_cost += str_to_float(dtv_usage.get("totalUsage").get("currentUsage"))
+
+        self.construct_extra_sensor(
+            new_products,
+            product,
+            "usage",
+            "euro",
+            str_to_float(dtv_usage.get("totalUsage").get("currentUsage")),
+            {**dtv_usage, **product_type_attr},
+        )
+        for device in devices.get("dtv"):
+            self.construct_extra_sensor(
+                new_products,
+                product,
+                "dtv device",
+                "dtv",
+                device.get("boxName"),
+                dict(device),
+            )
+
+    def create_mobile_sensors(
+        self, product, product_specs, product_type_attr, new_products
+    ) -> None:
+        """Create extra mobile sensors."""
+        type = product.product_type
+        identifier = product.product_identifier
+        plan_identifier = product.product_plan_identifier
+        usage = self._mobile_usage[identifier].result()
+        if usage is False:
+            log_debug("[create_extra_sensors|mobile|usage] Failed to fetch, skipping")
+            return
+        next_billing_date = usage.get("nextBillingDate")
+        if next_billing_date is False:
+            log_debug(
+                "[create_extra_sensors|mobile|next_billing_date] Failed to fetch, skipping"
+            )
+            return
+        next_billing_date_time = parse_billing_date(next_billing_date)
+        days_until = (next_billing_date_time - self._now).days
+        attr_to_merge = {
+            "days_until": days_until,
+            "next_billing_date": next_billing_date,
+        }
+        base_attrs = {**attr_to_merge, **product_type_attr}
+        if plan_identifier != identifier:
+            bundle_key = format_entity_name(f"{plan_identifier} {type} out of bundle")
+            bundleusage = self._mobile_bundle_usage[plan_identifier].result()
+            if bundleusage is False:
+                log_debug(
+                    "[create_extra_sensors|mobile|bundleusage] Failed to fetch, skipping"
                 )
-                new_products.update(
-                    self.construct_extra_sensor(
+                return
+            if bundle_key not in new_products:
+                """Bundle mobile sensors"""
+                log_debug(
+                    "[TelenetClient|create_extra_sensors] Create Bundle Sensor BundleId: %s",
+                    plan_identifier,
+                )
+                out_of_bundle = bundleusage.get("outOfBundle")
+                out_of_bundle_cost = str_to_float(out_of_bundle.get("usedUnits"))
+                self.total_cost += out_of_bundle_cost
+                self.construct_plan_extra_sensor(
+                    new_products,
+                    product,
+                    "out of bundle",
+                    "euro",
+                    out_of_bundle_cost,
+                    {**out_of_bundle, **base_attrs},
+                )
+                shared = bundleusage.get("shared")
+                for data in shared.get("data"):
+                    self.construct_plan_extra_sensor(
+                        new_products,
                         product,
-                        "daily usage",
-                        "data_usage",
-                        get_json_dict_path(
-                            product_daily_usage, "$.internetUsage[0].totalUsage.peak"
-                        ),
-                        self.create_extra_attributes_list(
-                            get_json_dict_path(
-                                product_daily_usage, "$.internetUsage[0].totalUsage"
-                            )
-                        )
-                        | {
-                            "daily_peak": daily_peak,
-                            "daily_off_peak": daily_off_peak,
-                            "daily_total": daily_total,
-                            "daily_date": daily_date,
+                        data.get("bucketType"),
+                        "usage_percentage_mobile",
+                        data.get("usedPercentage"),
+                        {
+                            "usage": f"{data.get('usedUnits')}/{data.get('startUnits')} {data.get('unitType')}",
+                            **data,
+                            **attr_to_merge,
                         },
                     )
-                )
-                new_products.update(
-                    self.construct_extra_sensor(
+                for data in shared.get("text"):
+                    self.construct_plan_extra_sensor(
+                        new_products,
                         product,
-                        "modem",
-                        "modem",
-                        modem.get("name"),
-                        self.create_extra_attributes_list(modem),
+                        "sms",
+                        "mobile_sms",
+                        data.get("usedUnits"),
+                        {"usage": f"{data.get('usedUnits')} SMSes", **data},
                     )
-                )
-                network_topology = clean_ipv6(self.network_topology(modem.get("mac")))
-                new_products.update(
-                    self.construct_extra_sensor(
+                for data in shared.get("voice"):
+                    used_time = float_to_timestring(
+                        data.get("usedUnits"), data.get("unitType")
+                    )
+                    self.construct_plan_extra_sensor(
+                        new_products,
                         product,
-                        "network",
-                        "network",
-                        network_topology.get("model"),
-                        self.create_extra_attributes_list(network_topology),
+                        "voice",
+                        "mobile_voice",
+                        used_time,
+                        {
+                            "usage": used_time,
+                            **data,
+                            **attr_to_merge,
+                        },
                     )
+            """ Child mobile sensors """
+            out_of_bundle = usage.get("outOfBundle")
+            out_of_bundle_cost = str_to_float(out_of_bundle.get("usedUnits"))
+            self.total_cost += out_of_bundle_cost
+            self.construct_extra_sensor(
+                new_products,
+                product,
+                "out of bundle",
+                "euro",
+                out_of_bundle_cost,
+                {**out_of_bundle, **base_attrs},
+            )
+            for data in usage.get("shared").get("data"):
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    data.get("name").lower(),
+                    "mobile_data",
+                    str_to_float(data.get("usedUnits")),
+                    {
+                        "usage": f"{data.get('usedUnits')} {data.get('unitType')}",
+                        **data,
+                        **attr_to_merge,
+                    },
+                    False,
+                    data.get("unitType"),
                 )
-                wireless_settings = self.wireless_settings(modem.get("mac"), identifier)
-                if wireless_settings is not False:
-                    wifi_qr = None
-                    new_products.update(
-                        self.construct_extra_sensor(
-                            product,
-                            "wi-fi",
-                            "wifi",
-                            wireless_settings.get("wirelessEnabled"),
-                            self.create_extra_attributes_list(wireless_settings),
-                        )
-                    )
-                    if "networkKey" in wireless_settings.get(
-                        "singleSSIDRoamingSettings"
-                    ):
-                        network_key = (
-                            wireless_settings.get("singleSSIDRoamingSettings")
-                            .get("networkKey")
-                            .replace(":", r"\:")
-                        )
-                        wifi_qr = f"WIFI:S:{wireless_settings.get('singleSSIDRoamingSettings').get('name')};T:WPA;P:{network_key};;"
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product, "wi-fi qr", "qr", wifi_qr
-                            )
-                        )
-            elif type == "dtv":
-                """-------------------"""
-                """| EXTRA DTV SENSORS |"""
-                """ ------------------- """
-                if not product.product_ignore_extra_sensor:
-                    billcycle = self.bill_cycles(type, identifier, 1)
-                    product_usage = self.product_usage(
-                        type,
-                        identifier,
-                        billcycle.get("start_date"),
-                        billcycle.get("end_date"),
-                    )
-                    if product_usage is False:
-                        log_debug(
-                            "[create_extra_sensors|dtv|product_usage] Failed to fetch, skipping"
-                        )
-                        continue
-                    devices = self.device_details(type, identifier)
-                    if devices is False:
-                        log_debug(
-                            "[create_extra_sensors|dtv|devices] Failed to fetch, skipping"
-                        )
-                        continue
-
-                    self.total_cost += str_to_float(
-                        get_json_dict_path(
-                            product_usage, "$.dtv.totalUsage.currentUsage"
-                        )
-                    )
-
-                    new_products.update(
-                        self.construct_extra_sensor(
-                            product,
-                            "usage",
-                            "euro",
-                            str_to_float(
-                                get_json_dict_path(
-                                    product_usage, "$.dtv.totalUsage.currentUsage"
-                                )
-                            ),
-                            self.create_extra_attributes_list(
-                                get_json_dict_path(product_usage, "$.dtv")
-                            )
-                            | product_type_attr,
-                        )
-                    )
-                    for idx, _data in enumerate(devices.get("dtv")):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                "dtv device",
-                                "dtv",
-                                get_json_dict_path(devices, f"$.dtv[{idx}].boxName"),
-                                self.create_extra_attributes_list(
-                                    get_json_dict_path(devices, f"$.dtv[{idx}]")
-                                ),
-                            )
-                        )
-            elif type == "mobile":
-                """----------------------"""
-                """| EXTRA MOBILE SENSORS |"""
-                """ ---------------------- """
-                if plan_identifier != identifier:
-                    bundle_key = format_entity_name(
-                        f"{self.user_details.get('identity_id')} {plan_identifier} {type} bundle"
-                    )
-                    usage = self.mobile_bundle_usage(plan_identifier, identifier)
-                    if usage is False:
-                        log_debug(
-                            "[create_extra_sensors|mobile|usage] Failed to fetch, skipping"
-                        )
-                        continue
-                    next_billing_date = usage.get("nextBillingDate")
-                    if next_billing_date is False:
-                        log_debug(
-                            "[create_extra_sensors|mobile|next_billing_date] Failed to fetch, skipping"
-                        )
-                        continue
-                    next_billing_date_time = datetime.strptime(
-                        usage.get("nextBillingDate"), DATETIME_FORMAT
-                    ).replace(tzinfo=None)
-                    days_until = (next_billing_date_time - datetime.now()).days
-                    attr_to_merge = {
-                        "days_until": days_until,
-                        "next_billing_date": next_billing_date,
-                    }
-                    bundleusage = self.mobile_bundle_usage(plan_identifier)
-                    if bundleusage is False:
-                        log_debug(
-                            "[create_extra_sensors|mobile|bundleusage] Failed to fetch, skipping"
-                        )
-                        continue
-                    if self.all_products.get(bundle_key) is None:
-                        """Bundle mobile sensors"""
-                        log_debug(
-                            f"[TelenetClient|create_extra_sensors] Create Bundle Sensor BundleId: {plan_identifier}"
-                        )
-                        self.total_cost += str_to_float(
-                            get_json_dict_path(bundleusage, "$.outOfBundle.usedUnits")
-                        )
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                "out of bundle",
-                                "euro",
-                                str_to_float(
-                                    get_json_dict_path(
-                                        bundleusage, "$.outOfBundle.usedUnits"
-                                    )
-                                ),
-                                self.create_extra_attributes_list(
-                                    get_json_dict_path(bundleusage, "$.outOfBundle")
-                                )
-                                | attr_to_merge
-                                | product_type_attr,
-                                use_plan_identifier=True,
-                            )
-                        )
-                        for data in bundleusage.get("shared").get("data"):
-                            new_products.update(
-                                self.construct_extra_sensor(
-                                    product,
-                                    data.get("bucketType"),
-                                    "usage_percentage_mobile",
-                                    data.get("usedPercentage"),
-                                    {
-                                        "usage": f"{data.get('usedUnits')}/{data.get('startUnits')} {data.get('unitType')}"
-                                    }
-                                    | data
-                                    | attr_to_merge,
-                                    use_plan_identifier=True,
-                                )
-                            )
-                        for data in bundleusage.get("shared").get("text"):
-                            new_products.update(
-                                self.construct_extra_sensor(
-                                    product,
-                                    "sms",
-                                    "mobile_sms",
-                                    data.get("usedUnits"),
-                                    {"usage": f"{data.get('usedUnits')} SMSes"} | data,
-                                    use_plan_identifier=True,
-                                )
-                            )
-                        for data in bundleusage.get("shared").get("voice"):
-                            new_products.update(
-                                self.construct_extra_sensor(
-                                    product,
-                                    "voice",
-                                    "mobile_voice",
-                                    float_to_timestring(
-                                        data.get("usedUnits"), data.get("unitType")
-                                    ),
-                                    {
-                                        "usage": float_to_timestring(
-                                            data.get("usedUnits"), data.get("unitType")
-                                        )
-                                    }
-                                    | data
-                                    | attr_to_merge,
-                                    use_plan_identifier=True,
-                                )
-                            )
-                    """ Child mobile sensors """
-                    self.total_cost += str_to_float(
-                        get_json_dict_path(usage, "$.outOfBundle.usedUnits")
-                    )
-                    new_products.update(
-                        self.construct_extra_sensor(
-                            product,
-                            "out of bundle",
-                            "euro",
-                            str_to_float(
-                                get_json_dict_path(usage, "$.outOfBundle.usedUnits")
-                            ),
-                            self.create_extra_attributes_list(
-                                get_json_dict_path(usage, "$.outOfBundle")
-                            )
-                            | attr_to_merge
-                            | product_type_attr,
-                        )
-                    )
-                    for data in usage.get("shared").get("data"):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                data.get("name").lower(),
-                                "mobile_data",
-                                str_to_float(data.get("usedUnits")),
-                                {
-                                    "usage": f"{data.get('usedUnits')} {data.get('unitType')}"
-                                }
-                                | data
-                                | attr_to_merge,
-                                False,
-                                data.get("unitType"),
-                            )
-                        )
-                    for data in usage.get("shared").get("text"):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                data.get("name").lower().replace("text", "sms"),
-                                "mobile_sms",
-                                data.get("usedUnits"),
-                                {"usage": f"{data.get('usedUnits')} SMSes"}
-                                | data
-                                | attr_to_merge,
-                            )
-                        )
-                    for data in usage.get("shared").get("voice"):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                data.get("name").lower(),
-                                "mobile_voice",
-                                float_to_timestring(
-                                    data.get("usedUnits"), data.get("unitType")
-                                ),
-                                {
-                                    "usage": float_to_timestring(
-                                        data.get("usedUnits"), data.get("unitType")
-                                    )
-                                }
-                                | data
-                                | attr_to_merge,
-                            )
-                        )
-                else:
-                    log_debug(
-                        f"[TelenetClient|MOBILE] {type} BundleId: {plan_identifier}, id: {identifier}, {product.product_description_key}"
-                    )
-                    usage = self.mobile_usage(identifier)
-                    if usage is False:
-                        log_debug(
-                            "[create_extra_sensors|mobile|usage] Failed to fetch, skipping"
-                        )
-                        continue
-                    next_billing_date = usage.get("nextBillingDate")
-                    next_billing_date_time = datetime.strptime(
-                        usage.get("nextBillingDate"), DATETIME_FORMAT
-                    ).replace(tzinfo=None)
-                    days_until = (next_billing_date_time - datetime.now()).days
-                    attr_to_merge = {
-                        "days_until": days_until,
-                        "next_billing_date": next_billing_date,
-                    }
-                    """ Non bundle mobile sensors """
-                    self.total_cost += str_to_float(
-                        get_json_dict_path(usage, "$.outOfBundle.usedUnits")
-                    )
-                    new_products.update(
-                        self.construct_extra_sensor(
-                            product,
-                            "out of bundle",
-                            "euro",
-                            str_to_float(
-                                get_json_dict_path(usage, "$.outOfBundle.usedUnits")
-                            ),
-                            self.create_extra_attributes_list(
-                                get_json_dict_path(usage, "$.outOfBundle")
-                            )
-                            | attr_to_merge
-                            | product_type_attr,
-                            use_plan_identifier=True,
-                        )
-                    )
-                    data = usage.get("total").get("data")
-                    if (
-                        int(data.get("startUnits")) > 0
-                        or int(data.get("remainingUnits")) > 0
-                        or int(data.get("usedUnits")) > 0
-                    ):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                "data",
-                                "mobile_data",
-                                str_to_float(data.get("usedUnits")),
-                                {
-                                    "usage": f"{data.get('usedUnits')} {data.get('unitType')}"
-                                }
-                                | data
-                                | attr_to_merge,
-                                False,
-                                data.get("unitType"),
-                            )
-                        )
-                    data = usage.get("total").get("text")
-                    if (
-                        int(data.get("startUnits")) > 0
-                        or int(data.get("remainingUnits")) > 0
-                        or int(data.get("usedUnits")) > 0
-                    ):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                "sms",
-                                "mobile_sms",
-                                data.get("usedUnits"),
-                                {
-                                    "usage": f"{data.get('usedUnits')} / {data.get('startUnits')} SMSes"
-                                }
-                                | data
-                                | attr_to_merge,
-                            )
-                        )
-                    data = usage.get("total").get("voice")
-                    if (
-                        int(data.get("startUnits")) > 0
-                        or int(data.get("remainingUnits")) > 0
-                        or int(data.get("usedUnits")) > 0
-                    ):
-                        new_products.update(
-                            self.construct_extra_sensor(
-                                product,
-                                "sms",
-                                "mobile_voice",
-                                float_to_timestring(
-                                    data.get("usedUnits"), data.get("unitType")
-                                ),
-                                {
-                                    "usage": f"{data.get('usedUnits')} / {data.get('startUnits')} {data.get('unitType').lower()}"
-                                }
-                                | data
-                                | attr_to_merge,
-                            )
-                        )
-
-        product_name = "current invoice"
-        product_key = format_entity_name(
-            f"{self.user_details.get('customer_number')} {product_name}"
-        )
-        new_products.update(
-            {
-                product_key: TelenetProduct(
-                    product_identifier=f"{self.user_details.get('customer_number')} {product_name}",
-                    product_type="invoice",
-                    product_description_key="euro",
-                    product_name=f"{product_name}",
-                    product_key=product_key,
-                    product_plan_identifier=self.user_details.get("customer_number"),
-                    product_plan_label="Customer",
-                    product_state=self.total_cost,
-                    product_extra_sensor=True,
+            for data in usage.get("shared").get("text"):
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    data.get("name").lower().replace("text", "sms"),
+                    "mobile_sms",
+                    data.get("usedUnits"),
+                    {
+                        "usage": f"{data.get('usedUnits')} SMSes",
+                        **data,
+                        **attr_to_merge,
+                    },
                 )
-            }
-        )
-        product_name = "user details"
-        product_key = format_entity_name(
-            f"{self.user_details.get('customer_number')} {product_name}"
-        )
-        new_products.update(
-            {
-                product_key: TelenetProduct(
-                    product_identifier=f"{product_name}",
-                    product_type="user",
-                    product_description_key="user",
-                    product_name=f"{product_name}",
-                    product_key=product_key,
-                    product_plan_identifier=self.user_details.get("customer_number"),
-                    product_plan_label="Customer",
-                    product_state=self.user_details.get("first_name"),
-                    product_extra_attributes=self.user_details,
-                    product_extra_sensor=True,
+            for data in usage.get("shared").get("voice"):
+                used_time = float_to_timestring(
+                    data.get("usedUnits"), data.get("unitType")
+                )
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    data.get("name").lower(),
+                    "mobile_voice",
+                    used_time,
+                    {
+                        "usage": used_time,
+                        **data,
+                        **attr_to_merge,
+                    },
+                )
+        else:
+            log_debug(
+                "[TelenetClient|MOBILE] %s BundleId: %s, id: %s, %s",
+                type,
+                plan_identifier,
+                identifier,
+                product.product_description_key,
+            )
+            """ Non bundle mobile sensors """
+            out_of_bundle = usage.get("outOfBundle")
+            out_of_bundle_cost = str_to_float(out_of_bundle.get("usedUnits"))
+            self.total_cost += out_of_bundle_cost
+            self.construct_plan_extra_sensor(
+                new_products,
+                product,
+                "out of bundle",
+                "euro",
+                out_of_bundle_cost,
+                {**out_of_bundle, **base_attrs},
+            )
+            data = usage.get("total").get("data")
+            if has_units(data):
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    "data",
+                    "mobile_data",
+                    str_to_float(data.get("usedUnits")),
+                    {
+                        "usage": f"{data.get('usedUnits')} {data.get('unitType')}",
+                        **data,
+                        **attr_to_merge,
+                    },
+                    False,
+                    data.get("unitType"),
+                )
+            data = usage.get("total").get("text")
+            if has_units(data):
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    "sms",
+                    "mobile_sms",
+                    data.get("usedUnits"),
+                    {
+                        "usage": f"{data.get('usedUnits')} / {data.get('startUnits')} SMSes",
+                        **data,
+                        **attr_to_merge,
+                    },
+                )
+            data = usage.get("total").get("voice")
+            if has_units(data):
+                self.construct_extra_sensor(
+                    new_products,
+                    product,
+                    "sms",
+                    "mobile_voice",
+                    float_to_timestring(data.get("usedUnits"), data.get("unitType")),
+                    {
+                        "usage": f"{data.get('usedUnits')} / {data.get('startUnits')} {data.get('unitType').lower()}",
+                        **data,
+                        **attr_to_merge,
+                    },
                 )
-            }
-        )
-        self.all_products.update(new_products)
-        return True
-
-    def create_extra_attributes_list(self, attr_list):
-        """Create extra attributes for a sensor."""
-        attributes = {}
-        for key in attr_list:
-            attributes[key] = attr_list[key]
-        return attributes
 
     def set_extra_attributes(self) -> bool:
         """Set extra attributes per product."""
-        for product in self.all_products:
-            product = self.all_products[product]
-            if not product.product_extra_sensor:
-                if len(product.product_subscription_info) > 0:
-                    info = product.product_subscription_info
-                else:
-                    info = self.plan_products.get(product.product_identifier)
-                log_debug(
-                    f"[TelenetClient|set_extra_attributes] Setting extra attributes for {product.product_identifier} Length: {len(info)}"
-                )
+        plan_products = self.plan_products
+        for product in self.all_products.values():
+            if product.product_extra_sensor:
+                continue
+            info = product.product_subscription_info or plan_products.get(
+                product.product_identifier, {}
+            )
+            log_debug(
+                "[TelenetClient|set_extra_attributes] Setting extra attributes for %s Length: %s",
+                product.product_identifier,
+                len(info),
+            )
 
-                extra_attributes = {}
-                if product.product_type == "internet":
-                    attributes = TelenetInternetProductExtraAttributes()
-                elif product.product_type == "mobile":
-                    attributes = TelenetMobileProductExtraAttributes()
-                elif product.product_type == "dtv":
-                    attributes = TelenetDtvProductExtraAttributes()
-                elif product.product_type == "telephone":
-                    attributes = TelenetTelephoneProductExtraAttributes()
-                elif product.product_type == "bundle":
-                    attributes = TelenetBundleProductExtraAttributes()
-                for key in dir(attributes):
-                    if key[0:2] != "__":
-                        if key in info:
-                            extra_attributes[key] = info.get(key)
-                product.product_extra_attributes |= extra_attributes
+            keys = EXTRA_ATTRIBUTE_KEYS.get(product.product_type, frozenset())
+            for key in keys.intersection(info):
+                product.product_extra_attributes[key] = info.get(key)
         return True
 
     def product_details(self, url):
-        """Fetch product_details."""
+        """Fetch product_details, cached per specurl until the next refresh."""
+        if url in self._product_details:
+            return self._product_details[url]
         response = self.request(url, "product_details", None, 200)
         if response is False:
             return False
-        return response.json()
+        self._product_details[url] = response_json(response)
+        return self._product_details[url]
 
     def plan_info(self):
         """Fetch PLAN product subscriptions."""
-        self.plan_products = {}
         log_debug("[TelenetClient|plan_info] Fetching plan info from Telenet")
         response = self.request(
             "https://api.prd.telenet.be/ocapi/public/api/product-service/v1/product-subscriptions?producttypes=PLAN",
@@ -1020,14 +1076,17 @@ class TelenetClient:
         )
         if response is False:
             return False
-        for plan in response.json():
-            self.plan_products[plan.get("identifier")] = plan
+        self.plan_products = {
+            plan.get("identifier"): plan for plan in response_json(response)
+        }
         return False
 
     def bill_cycles(self, product_type, product_identifier, count=1):
         """Fetch bill cycles."""
         log_debug(
-            f"[TelenetClient|bill_cycle] Fetching bill_cycles info from Telenet for {product_identifier} ({product_type})"
+            "[TelenetClient|bill_cycle] Fetching bill_cycles info from Telenet for %s (%s)",
+            product_identifier,
+            product_type,
         )
         response = self.request(
             f"https://api.prd.telenet.be/ocapi/public/api/billing-service/v1/account/products/{product_identifier}/billcycle-details?producttype={product_type}&count={count}",
@@ -1037,12 +1096,13 @@ class TelenetClient:
         )
         if response is False:
             return False
-        cycle = response.json().get("billCycles")[0]
+        cycles = response_json(response).get("billCycles")
+        cycle = cycles[0]
         if product_type == "internet":
             return {
                 "start_date": cycle.get("startDate"),
                 "end_date": cycle.get("endDate"),
-                "cycles": response.json().get("billCycles"),
+                "cycles": cycles,
             }
         else:
             return {
@@ -1060,7 +1120,7 @@ class TelenetClient:
         )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def product_daily_usage(
         self, product_type, product_identifier, bill_cycle, from_date, to_date
@@ -1076,27 +1136,34 @@ class TelenetClient:
             return False
         if response.status_code != 200:
             return {}
-        return response.json()
+        return response_json(response)
 
     def product_subscriptions(self):
         """Fetch product subscriptions for all product types."""
-        for product_type in self.product_types:
-            log_debug(
-                f"[TelenetClient|product_subscriptions] Fetching product plan infos from Telenet for {product_type}"
-            )
-            response = self.request(
-                f"https://api.prd.telenet.be/ocapi/public/api/product-service/v1/product-subscriptions?producttypes={product_type.upper()}",
-                "[TelenetClient|product_subscriptions]",
-                None,
-                200,
-            )
-            if response is False:
-                continue
-            for product in response.json():
+        for subscriptions in self.executor.map(
+            self.product_subscription, self.product_types
+        ):
+            for product in subscriptions:
                 self.all_products[
                     product.get("identifier")
                 ].product_subscription_info = product
 
+    def product_subscription(self, product_type) -> list:
+        """Fetch product subscriptions for a product type."""
+        log_debug(
+            "[TelenetClient|product_subscriptions] Fetching product plan infos from Telenet for %s",
+            product_type,
+        )
+        response = self.request(
+            f"https://api.prd.telenet.be/ocapi/public/api/product-service/v1/product-subscriptions?producttypes={product_type.upper()}",
+            "[TelenetClient|product_subscriptions]",
+            None,
+            200,
+        )
+        if response is False:
+            return []
+        return response_json(response)
+
     def mobile_usage(self, product_identifier):
         """Fetch mobile usage."""
         response = self.request(
@@ -1107,7 +1174,7 @@ class TelenetClient:
         )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def mobile_bundle_usage(self, bundle_identifier, line_identifier=None):
         """Fetch mobile bundle usage."""
@@ -1127,7 +1194,7 @@ class TelenetClient:
             )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def modems(self, product_identifier):
         """Fetch modem info."""
@@ -1139,7 +1206,7 @@ class TelenetClient:
         )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def network_topology(self, mac):
         """Fetch network topology."""
@@ -1151,7 +1218,7 @@ class TelenetClient:
         )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def wireless_settings(self, mac, product_identifier):
         """Fetch wireless settings."""
@@ -1163,7 +1230,7 @@ class TelenetClient:
         )
         if response is False or response.status_code == 500:
             return False
-        return response.json()
+        return response_json(response)
 
     def device_details(self, product_type, product_identifier):
         """Fetch device details."""
@@ -1175,15 +1242,17 @@ class TelenetClient:
         )
         if response is False:
             return False
-        return response.json()
+        return response_json(response)
 
     def address(self, address_id):
         """Fetch address."""
-        log_debug(f"[TelenetClient|address] Fetching address {address_id}")
+        log_debug("[TelenetClient|address] Fetching address %s", address_id)
         if address_id is None or len(address_id) == 0:
             return {}
         if self.addresses.get(address_id) is not None:
             return self.addresses.get(address_id)
+        if address_id in self._missing_addresses:
+            return False
         response = self.request(
             f"https://api.prd.telenet.be/ocapi/public/api/contact-service/v1/contact/addresses/{address_id}",
             "[TelenetClient|address]",
@@ -1191,6 +1260,8 @@ class TelenetClient:
             200,
         )
         if response is False:
+            self._missing_addresses.add(address_id)
             return False
-        self.addresses |= {address_id: response.json()}
-        return response.json()
+        address = response_json(response)
+        self.addresses[address_id] = address
+        return address
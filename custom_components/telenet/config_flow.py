@@ -1,6 +1,10 @@
 """Config flow to configure the Telenet integration."""
+import asyncio
+import sys
 from abc import ABC
 from abc import abstractmethod
+from hashlib import blake2b
+from time import monotonic
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -18,11 +22,14 @@ from homeassistant.helpers.selector import TextSelector
 from homeassistant.helpers.selector import TextSelectorConfig
 from homeassistant.helpers.selector import TextSelectorType
 from homeassistant.helpers.typing import UNDEFINED
+from requests import RequestException
 
 from .client import TelenetClient
 from .const import DEFAULT_LANGUAGE
 from .const import DOMAIN
+from .const import FLOW_CLIENTS
 from .const import LANGUAGE_CHOICES
+from .const import LOGIN_CACHE_TTL
 from .const import NAME
 from .exceptions import BadCredentialsException
 from .exceptions import TelenetServiceException
@@ -34,6 +41,51 @@ DEFAULT_ENTRY_DATA = TelenetConfigEntryData(
     password=None,
     language=DEFAULT_LANGUAGE,
 )
+_DOMAIN_PREFIX = sys.intern(f"{DOMAIN}_")
+LANGUAGE_SET = frozenset(LANGUAGE_CHOICES)
+LANGUAGE_IN = vol.In(LANGUAGE_CHOICES)
+CONNECTION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.EMAIL, autocomplete="username")
+        ),
+        vol.Required(CONF_PASSWORD): TextSelector(
+            TextSelectorConfig(
+                type=TextSelectorType.PASSWORD, autocomplete="current-password"
+            )
+        ),
+        vol.Required(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): LANGUAGE_IN,
+    }
+)
+LANGUAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_LANGUAGE): LANGUAGE_IN,
+    }
+)
+PASSWORD_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PASSWORD): cv.string,
+    }
+)
+_LOGIN_CACHE: dict[tuple[str, str, str], tuple[float, dict]] = {}
+_LOGIN_LOCKS: dict[tuple[str, str, str], asyncio.Lock] = {}
+
+
+def _prune_login_cache() -> None:
+    """Drop expired logins and the idle locks of credentials not cached."""
+    now = monotonic()
+    for key in [
+        key
+        for key, (logged_in, _) in _LOGIN_CACHE.items()
+        if now - logged_in >= LOGIN_CACHE_TTL
+    ]:
+        del _LOGIN_CACHE[key]
+    for key in [
+        key
+        for key, lock in _LOGIN_LOCKS.items()
+        if key not in _LOGIN_CACHE and not lock.locked()
+    ]:
+        del _LOGIN_LOCKS[key]
 
 
 class TelenetCommonFlow(ABC, FlowHandler):
@@ -43,27 +95,91 @@ class TelenetCommonFlow(ABC, FlowHandler):
         """Initialize TelenetCommonFlow."""
         self.initial_data = initial_data
         self.new_entry_data = TelenetConfigEntryData()
+        self._merged = DEFAULT_ENTRY_DATA | initial_data
         self.new_title: str | None = None
+        self._submit_lock = asyncio.Lock()
+        self._clients: dict[tuple[str, str], TelenetClient] = {}
 
     @abstractmethod
     def finish_flow(self) -> FlowResult:
         """Finish the flow."""
 
     def new_data(self):
-        """Construct new data."""
-        return DEFAULT_ENTRY_DATA | self.initial_data | self.new_entry_data
-
-    async def async_validate_input(self, user_input: dict[str, Any]) -> None:
-        """Validate user credentials."""
+        """Return the initial data with the changes of this flow applied."""
+        return dict(self._merged)
+
+    def update_entry_data(self, data: TelenetConfigEntryData) -> None:
+        """Record changed entry data."""
+        self.new_entry_data |= data
+        self._merged |= data
+
+    def flow_client(self, user_input: dict[str, Any]) -> TelenetClient:
+        """Return the client of this flow for the given username and language."""
+        key = (user_input[CONF_USERNAME], user_input[CONF_LANGUAGE])
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = TelenetClient(
+                username=user_input[CONF_USERNAME],
+                password=user_input[CONF_PASSWORD],
+                language=user_input[CONF_LANGUAGE],
+            )
+        elif client.password != user_input[CONF_PASSWORD]:
+            client.password = user_input[CONF_PASSWORD]
+            client.session.cookies.clear()
+        return client
+
+    def hand_over_client(self) -> None:
+        """Keep the client of the new entry data for the setup of the entry."""
+        data = self.new_data()
+        client = self._clients.pop((data[CONF_USERNAME], data[CONF_LANGUAGE]), None)
+        if client is not None and client.user_details:
+            self.hass.data.setdefault(FLOW_CLIENTS, {})[self.unique_id] = client
+
+    def close_clients(self) -> None:
+        """Close the sessions of the clients opened by this flow."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
 
-        client = TelenetClient(
-            username=user_input[CONF_USERNAME],
-            password=user_input[CONF_PASSWORD],
-            language=user_input[CONF_LANGUAGE],
+    @callback
+    def async_remove(self) -> None:
+        """Close the sessions left open when the flow is aborted or removed."""
+        self.close_clients()
+        super().async_remove()
+
+    def entry_customer_number(self) -> str | None:
+        """Return the customer number of the config entry being changed."""
+        config_entry = getattr(self, "config_entry", None)
+        if config_entry is None or config_entry.unique_id is None:
+            return None
+        return config_entry.unique_id.removeprefix(_DOMAIN_PREFIX)
+
+    async def async_validate_input(
+        self, user_input: dict[str, Any], authenticate_only: bool = False
+    ) -> dict:
+        """Validate user credentials, reusing a recent login for the same input."""
+        key = (
+            user_input[CONF_USERNAME],
+            blake2b(user_input[CONF_PASSWORD].encode(), digest_size=16).hexdigest(),
+            user_input[CONF_LANGUAGE],
         )
-
-        user_details = await self.hass.async_add_executor_job(client.login)
-
+        _prune_login_cache()
+        if key in _LOGIN_CACHE:
+            return _LOGIN_CACHE[key][1]
+
+        client = self.flow_client(user_input)
+        if authenticate_only:
+            await self.hass.async_add_executor_job(client.authenticate)
+            return {}
+        # Only concurrent logins with the same credentials wait for each other
+        lock = _LOGIN_LOCKS.get(key)
+        if lock is None:
+            lock = _LOGIN_LOCKS[key] = asyncio.Lock()
+        async with lock:
+            if key in _LOGIN_CACHE:
+                return _LOGIN_CACHE[key][1]
+            user_details = await self.hass.async_add_executor_job(client.login)
+            _LOGIN_CACHE[key] = (monotonic(), user_details)
         return user_details
 
     async def async_step_connection_init(
@@ -76,31 +192,18 @@ class TelenetCommonFlow(ABC, FlowHandler):
             user_input = self.new_data() | user_input
             test = await self.test_connection(user_input)
             if not test["errors"]:
-                self.new_title = test["user_details"].get("username")
-                self.new_entry_data |= user_input
-                await self.async_set_unique_id(
-                    f"{DOMAIN}_" + test["user_details"].get("customer_number")
-                )
+                user_details = test["user_details"]
+                customer_number = user_details.get("customer_number")
+                self.new_title = user_details.get("username")
+                self.update_entry_data(user_input)
+                await self.async_set_unique_id(f"{_DOMAIN_PREFIX}{customer_number}")
                 self._abort_if_unique_id_configured()
                 log_debug(f"New account {self.new_title} added")
                 return self.finish_flow()
             errors = test["errors"]
-        fields = {
-            vol.Required(CONF_USERNAME): TextSelector(
-                TextSelectorConfig(type=TextSelectorType.EMAIL, autocomplete="username")
-            ),
-            vol.Required(CONF_PASSWORD): TextSelector(
-                TextSelectorConfig(
-                    type=TextSelectorType.PASSWORD, autocomplete="current-password"
-                )
-            ),
-            vol.Required(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(
-                LANGUAGE_CHOICES
-            ),
-        }
         return self.async_show_form(
             step_id="connection_init",
-            data_schema=vol.Schema(fields),
+            data_schema=CONNECTION_SCHEMA,
             errors=errors,
         )
 
@@ -109,47 +212,50 @@ class TelenetCommonFlow(ABC, FlowHandler):
         errors: dict = {}
 
         if user_input is not None:
-            if user_input[CONF_LANGUAGE] not in LANGUAGE_CHOICES:
+            if user_input[CONF_LANGUAGE] not in LANGUAGE_SET:
                 errors["base"] = "language_not_found"
             if not errors:
-                self.new_entry_data |= TelenetConfigEntryData(
-                    language=user_input[CONF_LANGUAGE],
+                self.update_entry_data(
+                    TelenetConfigEntryData(
+                        language=user_input[CONF_LANGUAGE],
+                    )
                 )
                 log_debug(f"Language set to : {user_input[CONF_LANGUAGE]}")
                 return self.finish_flow()
 
-        fields = {
-            vol.Required(CONF_LANGUAGE): vol.In(LANGUAGE_CHOICES),
-        }
         return self.async_show_form(
             step_id="language",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(fields), {"language": self.initial_data.get(CONF_LANGUAGE)}
+                LANGUAGE_SCHEMA, {"language": self.initial_data.get(CONF_LANGUAGE)}
             ),
             errors=errors,
         )
 
-    async def test_connection(self, user_input: dict | None = None) -> dict:
-        """Test the connection to Telenet."""
+    async def test_connection(
+        self, user_input: dict | None = None, authenticate_only: bool = False
+    ) -> dict:
+        """Test the connection to Telenet with already merged entry data."""
         errors: dict = {}
         user_details: dict = {}
 
         if user_input is not None:
-            user_input = self.new_data() | user_input
-            try:
-                user_details = await self.async_validate_input(user_input)
-            except AssertionError as exception:
-                errors["base"] = "cannot_connect"
-                log_debug(f"[async_step_password|login] AssertionError {exception}")
-            except ConnectionError:
-                errors["base"] = "cannot_connect"
-            except TelenetServiceException:
-                errors["base"] = "service_error"
-            except BadCredentialsException:
-                errors["base"] = "invalid_auth"
-            except Exception as exception:
-                errors["base"] = "unknown"
-                log_debug(exception)
+            async with self._submit_lock:
+                try:
+                    user_details = await self.async_validate_input(
+                        user_input, authenticate_only
+                    )
+                except AssertionError as exception:
+                    errors["base"] = "cannot_connect"
+                    log_debug(f"[async_step_password|login] AssertionError {exception}")
+                except RequestException:
+                    errors["base"] = "cannot_connect"
+                except TelenetServiceException:
+                    errors["base"] = "service_error"
+                except BadCredentialsException:
+                    errors["base"] = "invalid_auth"
+                except ValueError as exception:
+                    errors["base"] = "service_error"
+                    log_debug(f"[test_connection] Invalid response {exception}")
         return {"user_details": user_details, "errors": errors}
 
     async def async_step_password(self, user_input: dict | None = None) -> FlowResult:
@@ -158,23 +264,20 @@ class TelenetCommonFlow(ABC, FlowHandler):
 
         if user_input is not None:
             user_input = self.new_data() | user_input
-            test = await self.test_connection(user_input)
+            test = await self.test_connection(user_input, authenticate_only=True)
             if not test["errors"]:
-                self.new_entry_data |= TelenetConfigEntryData(
-                    password=user_input[CONF_PASSWORD],
-                )
-                log_debug(
-                    f"Password changed for {test['user_details'].get('customer_number')}"
+                self.update_entry_data(
+                    TelenetConfigEntryData(
+                        password=user_input[CONF_PASSWORD],
+                    )
                 )
+                log_debug(f"Password changed for {self.entry_customer_number()}")
                 return self.finish_flow()
 
-        fields = {
-            vol.Required(CONF_PASSWORD): cv.string,
-        }
         return self.async_show_form(
             step_id="password",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(fields),
+                PASSWORD_SCHEMA,
                 self.initial_data
                 | TelenetConfigEntryData(
                     password=None,
@@ -197,7 +300,8 @@ class TelenetOptionsFlow(TelenetCommonFlow, OptionsFlow):
     @callback
     def finish_flow(self) -> FlowResult:
         """Update the ConfigEntry and finish the flow."""
-        new_data = DEFAULT_ENTRY_DATA | self.initial_data | self.new_entry_data
+        self.close_clients()
+        new_data = self.new_data()
         self.hass.config_entries.async_update_entry(
             self.config_entry,
             data=new_data,
@@ -239,10 +343,12 @@ class TelenetConfigFlow(TelenetCommonFlow, ConfigFlow, domain=DOMAIN):
     @callback
     def finish_flow(self) -> FlowResult:
         """Create the ConfigEntry."""
+        self.hand_over_client()
+        self.close_clients()
         title = self.new_title or NAME
         return self.async_create_entry(
             title=title,
-            data=DEFAULT_ENTRY_DATA | self.new_entry_data,
+            data=self.new_data(),
         )
 
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
@@ -29,13 +29,24 @@ BASE_HEADERS = {
     "User-Agent": USER_AGENT,
     "Referer": DEFAULT_TELENET_ENVIRONMENT.referer,
     "x-alt-referer": DEFAULT_TELENET_ENVIRONMENT.x_alt_referer,
+    "Connection": "keep-alive",
 }
 
+AUTHORIZE_URL_TEMPLATE = "{openid}/oauth/authorize?client_id=ocapi&response_type=code&claims=%7B%22id_token%22%3A%7B%22http%3A%2F%2Ftelenet.be%2Fclaims%2Froles%22%3Anull%2C%22http%3A%2F%2Ftelenet.be%2Fclaims%2Flicenses%22%3Anull%7D%7D&lang=nl&state={state}&nonce={nonce}&prompt=login"
+
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 COORDINATOR_UPDATE_INTERVAL = timedelta(minutes=15)
 CONNECTION_RETRY = 5
 REQUEST_TIMEOUT = 20
+REQUEST_WORKERS = 8
+REQUEST_POOL_SIZE = 32
+REQUEST_RETRY = 2
+REQUEST_RETRY_BACKOFF = 0.3
+SERVICE_ERROR_CODES = frozenset({"OCAPI-ERR-667"})
+LOGIN_CACHE_TTL = 30
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
 DEFAULT_LANGUAGE = "nl"
 LANGUAGE_CHOICES = ["nl", "fr", "en"]
 WEBSITE = "https://mijn.telenet.be/mijntelenet/"
@@ -47,6 +58,7 @@ with open(manifestfile) as json_file:
     manifest_data = json.load(json_file)
 
 DOMAIN = manifest_data.get("domain")
+FLOW_CLIENTS = f"{DOMAIN}_flow_clients"
 NAME = manifest_data.get("name")
 VERSION = manifest_data.get("version")
 ISSUEURL = manifest_data.get("issue_tracker")
@@ -69,7 +69,7 @@ class TelenetEntity(CoordinatorEntity[TelenetDataUpdateCoordinator]):
                     return
         log_debug(
             f"[TelenetEntity|_handle_coordinator_update] {self._attr_unique_id}: async_write_ha_state ignored since API fetch failed or not found",
-            True,
+            force=True,
         )
 
     @property
@@ -14,7 +14,7 @@ class TelenetConfigEntryData(TypedDict):
     language: str | None
 
 
-@dataclass
+@dataclass(frozen=True, eq=False, slots=True)
 class TelenetEnvironment:
     """Class to describe a Telenet environment."""
 
@@ -24,7 +24,7 @@ class TelenetEnvironment:
     x_alt_referer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TelenetProduct:
     """Telenet product model."""
 
@@ -47,49 +47,57 @@ class TelenetProduct:
     native_unit_of_measurement: str = None
 
 
-class TelenetBaseProductExtraAttributes:
+class TelenetBaseProductExtraAttributes(TypedDict, total=False):
     """Telenet Product base extra attributes."""
 
-    activationDate: str = ""
-    identifier: str = ""
-    label: str = ""
-    status: str = ""
-    productType: str = ""
-    specurl: str = ""
+    activationDate: str
+    identifier: str
+    label: str
+    status: str
+    productType: str
+    specurl: str
 
 
-class TelenetInternetProductExtraAttributes(TelenetBaseProductExtraAttributes):
+class TelenetInternetProductExtraAttributes(
+    TelenetBaseProductExtraAttributes, total=False
+):
     """Telenet Internet extra attributes."""
 
-    internetType: str = ""
+    internetType: str
 
 
-class TelenetMobileProductExtraAttributes(TelenetBaseProductExtraAttributes):
+class TelenetMobileProductExtraAttributes(
+    TelenetBaseProductExtraAttributes, total=False
+):
     """Telenet Mobile extra attributes."""
 
-    isDataOnlyPlan: str = ""
-    bundleIdentifier: str = ""
-    hasVoiceMail: bool = False
-    bundleType: str = ""
+    isDataOnlyPlan: str
+    bundleIdentifier: str
+    hasVoiceMail: bool
+    bundleType: str
 
 
-class TelenetDtvProductExtraAttributes(TelenetBaseProductExtraAttributes):
+class TelenetDtvProductExtraAttributes(TelenetBaseProductExtraAttributes, total=False):
     """Telenet DTV extra attributes."""
 
-    bundleIdentifier: str = ""
-    isInteractive: bool = False
-    lineType: str = ""
+    bundleIdentifier: str
+    isInteractive: bool
+    lineType: str
 
 
-class TelenetTelephoneProductExtraAttributes(TelenetBaseProductExtraAttributes):
+class TelenetTelephoneProductExtraAttributes(
+    TelenetBaseProductExtraAttributes, total=False
+):
     """Telenet DTV extra attributes."""
 
-    hasVoiceMail: bool = False
+    hasVoiceMail: bool
 
 
-class TelenetBundleProductExtraAttributes(TelenetBaseProductExtraAttributes):
+class TelenetBundleProductExtraAttributes(
+    TelenetBaseProductExtraAttributes, total=False
+):
     """Telenet DTV extra attributes."""
 
-    products: list = field(default_factory=list)
-    bundleFamily: str = ""
-    hasActiveMyBill: bool = False
+    products: list
+    bundleFamily: str
+    hasActiveMyBill: bool
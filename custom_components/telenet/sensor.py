@@ -118,7 +118,7 @@ async def async_setup_entry(
             else:
                 log_debug(
                     f"[sensor|async_setup_entry|no support type found] {product.product_identifier}, type: {product.product_description_key}, keys: {SUPPORTED_KEYS.get(product.product_description_key)}",
-                    True,
+                    force=True,
                 )
 
         async_add_entities(entities)
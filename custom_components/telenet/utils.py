@@ -3,27 +3,50 @@ from __future__ import annotations
 
 import logging
 import re
+from datetime import datetime
+from functools import lru_cache
 
-from jsonpath import jsonpath
+import orjson
 
+from .const import DATETIME_FORMAT
 from .const import SHOW_DEBUG_AS_WARNING
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def log_debug(input, force=False) -> None:
-    """Log to logger as debug or force as warning."""
+def log_debug(input, *args, force=False) -> None:
+    """Log to logger as debug or force as warning, args are formatted lazily."""
     if SHOW_DEBUG_AS_WARNING is True or force is True:
-        _LOGGER.warning(input)
-    else:
-        _LOGGER.debug(input)
+        _LOGGER.warning(input, *args)
+    elif _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(input, *args)
+
+
+def response_json(response):
+    """Decode the JSON body of a response with orjson."""
+    return orjson.loads(response.content)
 
 
+@lru_cache(maxsize=2048)
 def str_to_float(input) -> float:
     """Transform float to string."""
     return float(input.replace(",", "."))
 
 
+def has_units(data: dict) -> bool:
+    """Return True when any unit counter of a usage block is not zero."""
+    return any(
+        str_to_float(str(data.get(key) or 0)) != 0
+        for key in ("startUnits", "remainingUnits", "usedUnits")
+    )
+
+
+@lru_cache(maxsize=64)
+def parse_billing_date(billing_date) -> datetime:
+    """Parse a billing date to a naive datetime, cached per date string."""
+    return datetime.strptime(billing_date, DATETIME_FORMAT).replace(tzinfo=None)
+
+
 def float_to_timestring(float_time, unit_type) -> str:
     """Transform float to timestring."""
     float_time = str_to_float(float_time)
@@ -46,6 +69,7 @@ def float_to_timestring(float_time, unit_type) -> str:
     return result.strip()
 
 
+@lru_cache(maxsize=1024)
 def format_entity_name(string: str) -> str:
     """Format entity name."""
     string = string.strip()
@@ -63,18 +87,11 @@ def sizeof_fmt(num, suffix="b"):
     return f"{num:.1f}Yi{suffix}"
 
 
-def get_json_dict_path(dictionary, path):
-    """Fetch info based on jsonpath from dict."""
-    # log_debug(f"[get_json_dict_path] Path: {path}, Dict: {dictionary}")
-    json_dict = jsonpath(dictionary, path)
-    if isinstance(json_dict, list):
-        json_dict = json_dict[0]
-    return json_dict
-
-
 def get_localized(language, localizedcontent):
     """Fetch localized content."""
     # log_debug(f"[get_localized] {language} {localizedcontent}")
+    if not localizedcontent:
+        return {}
     for lang in localizedcontent:
         if language == lang.get("locale"):
             return lang
@@ -88,7 +105,7 @@ def clean_ipv6(data):
         for idx, item in enumerate(data):
             if "ipType" in item and "ipAddress" in item:
                 if item["ipType"] == "IPv6":
-                    log_debug(f"[utils|clean_ipv6] IPv6 address removed: {item}")
+                    log_debug("[utils|clean_ipv6] IPv6 address removed: %s", item)
                     del data[idx]
             else:
                 data[idx] = clean_ipv6(data[idx])
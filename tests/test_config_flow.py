@@ -0,0 +1,40 @@
+"""Tests for the Telenet config flow."""
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_LANGUAGE
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.const import CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.telenet.const import DOMAIN
+
+
+async def test_login_not_found_shows_service_error(hass: HomeAssistant) -> None:
+    """A 404 on login.do ends in a service_error form instead of a crash."""
+    userdetails = MagicMock(status_code=401, text="state,nonce")
+    authorize = MagicMock(status_code=200, url="https://login.telenet.be/openid/login")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "connection_init"
+
+    with patch(
+        "custom_components.telenet.client.TelenetClient.request",
+        side_effect=[userdetails, authorize, False],
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_USERNAME: "not-found@example.com",
+                CONF_PASSWORD: "secret",
+                CONF_LANGUAGE: "nl",
+            },
+        )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "service_error"}